@@ -5,12 +5,26 @@ No external dependencies. Run with: python3 agc_console.py
 """
 
 import os
+import queue
 import random
+import threading
 import time
 import tkinter as tk
 from tkinter import TclError
 
+# Display labels for executive states, and the suspended-row blink colours (off, on)
+_STATE_LABELS = {"OVERLOAD": "⚠ OVERLOAD", "COOLDOWN": "… COOL-DOWN", "STABLE": "✅ STABLE"}
+_BLINK_FG = ("#fbbf24", "#f87171")
+
+def _set_if_changed(var, value):
+    # StringVar.set always notifies Tk and invalidates the bound label; skip no-op writes
+    if var.get() != value:
+        var.set(value)
+
 class AGCSystem:
+    # Possible sensor load readings, shared across cycles
+    _LOAD_CHOICES = (0.6, 0.8, 1.0, 1.2, 1.5, 1.8, 2.0)
+
     def __init__(self):
         # lower priority number = more critical
         self.tasks = {
@@ -19,6 +33,10 @@ class AGCSystem:
             "telemetry":        {"priority": 3, "active": True, "blink": False},
             "camera_recording": {"priority": 4, "active": True, "blink": False}
         }
+        # Tasks are static, so resolve the priority order once
+        self._by_priority = tuple(sorted(self.tasks.items(), key=lambda kv: kv[1]["priority"]))
+        # Overload gate (priority <= 2 stays online) is static too: evaluate it once per task
+        self._overload_mask = tuple((task, task["priority"] <= 2) for _, task in self._by_priority)
         self.error_flag = False
         self.overload_count = 0
         self.cycle = 0
@@ -33,26 +51,24 @@ class AGCSystem:
 
     def simulate_sensor_load(self):
         # Random load spikes emulate radar + guidance contention
-        return random.choice([0.6, 0.8, 1.0, 1.2, 1.5, 1.8, 2.0])
+        return random.choice(self._LOAD_CHOICES)
 
     def check_system_load(self):
         load = self.simulate_sensor_load()
-        if load > 1.0:
-            self.error_flag = True
+        self.error_flag = load > 1.0
+        if self.error_flag:
             self.overload_count += 1
-        else:
-            self.error_flag = False
-            if self.overload_count > 0:
-                self.overload_count -= 1
+        elif self.overload_count:
+            self.overload_count -= 1  # gradual cool-down
         return load
 
     def recover_and_prioritize(self):
         # Overload: preserve critical tasks, suspend non-critical
         if self.error_flag:
-            for name, task in sorted(self.tasks.items(), key=lambda t: t[1]["priority"]):
-                task["active"] = task["priority"] <= 2
+            for task, critical in self._overload_mask:
+                task["active"] = critical
                 # blink non-critical when suspended to draw attention
-                task["blink"] = not task["active"]
+                task["blink"] = not critical
             return "OVERLOAD"
         # Stable: if cool-down complete, resume all tasks
         if self.overload_count == 0:
@@ -64,6 +80,11 @@ class AGCSystem:
         return "COOLDOWN"
 
 class AGCMissionConsole(tk.Tk):
+    # Load bar colours: nominal (<= 1.0x), strained (<= 1.5x), overloaded
+    _LOAD_COLORS = ("#34d399", "#f59e0b", "#ef4444")
+    # How often the Tk thread polls for new executive snapshots
+    _POLL_MS = 50
+
     def __init__(self, agc: AGCSystem, refresh_ms=800):
         super().__init__()
         self.title("Apollo Guidance Computer — Mission Console")
@@ -74,6 +95,14 @@ class AGCMissionConsole(tk.Tk):
         self.last_blink_state = False
         self.state = "INIT"
         self.load = 0.0
+        self.cycle = 0
+        self.active = tuple(info["active"] for info in agc.tasks.values())
+        # Executive worker -> Tk thread: (cycle, load, state, active) snapshots
+        self._snapshots = queue.SimpleQueue()
+        self._halt = threading.Event()
+        # Last rendered values, so unchanged widgets are not reconfigured
+        self._prev_load = None
+        self._row_state = {}  # task name -> (text, fg) last applied to its status label
         self._build_ui()
         self._update_ui(initial=True)
 
@@ -152,47 +181,72 @@ class AGCMissionConsole(tk.Tk):
     def start(self):
         if not self.agc.running:
             self.agc.running = True
+            # Fresh halt event per run, so a worker from a previous run cannot be revived
+            self._halt = threading.Event()
+            threading.Thread(target=self._logic_loop, args=(self._halt,), daemon=True).start()
             self._tick()
 
     def stop(self):
         self.agc.running = False
+        self._halt.set()
+
+    def _logic_loop(self, halt):
+        # Producer: runs the executive at refresh_ms, off the Tk thread
+        interval = self.refresh_ms / 1000
+        while not halt.is_set():
+            self._update_logic()
+            halt.wait(interval)
 
     def _tick(self):
         if not self.agc.running:
             return
-        self._update_logic()
-        self._update_ui()
-        self.after(self.refresh_ms, self._tick)
+        # Sole consumer: drain every pending snapshot, render only the newest
+        snapshot = None
+        while True:
+            try:
+                snapshot = self._snapshots.get_nowait()
+            except queue.Empty:
+                break
+        if snapshot is not None:
+            self.cycle, self.load, self.state, self.active = snapshot
+            self._update_ui()
+        self.after(self._POLL_MS, self._tick)
 
     def _update_logic(self):
-        self.load, self.state = self.agc.advance_cycle()
+        load, state = self.agc.advance_cycle()
+        active = tuple(info["active"] for info in self.agc.tasks.values())
+        self._snapshots.put((self.agc.cycle, load, state, active))
 
     def _update_ui(self, initial=False):
         # Cycle & state
-        self.cycle_var.set(f"Cycle: {self.agc.cycle}")
-        state_text = {"OVERLOAD": "⚠ OVERLOAD", "COOLDOWN": "… COOL-DOWN", "STABLE": "✅ STABLE"}.get(self.state, self.state)
-        self.state_var.set(f"State: {state_text}")
-        self.alert_var.set("1201/1202-like Executive Overflow" if self.state == "OVERLOAD" else "")
-
-        # Load bar (map 0.0–2.0x to 10–710 px)
-        clamped = max(0.0, min(self.load, 2.0))
-        x = 10 + int(clamped * (700 / 2.0))
-        color = "#34d399" if clamped <= 1.0 else "#f59e0b" if clamped <= 1.5 else "#ef4444"
-        self.canvas.itemconfig(self.load_rect, fill=color)
-        self.canvas.coords(self.load_rect, 10, 10, x, 30)
+        _set_if_changed(self.cycle_var, f"Cycle: {self.cycle}")
+        state_text = _STATE_LABELS.get(self.state, self.state)
+        _set_if_changed(self.state_var, f"State: {state_text}")
+        _set_if_changed(self.alert_var, "1201/1202-like Executive Overflow" if self.state == "OVERLOAD" else "")
+
+        # Load bar (map 0.0–2.0x to 10–710 px); only redraw when the reading moved
+        load_key = round(self.load, 2)
+        if load_key != self._prev_load:
+            self._prev_load = load_key
+            clamped = max(0.0, min(self.load, 2.0))
+            x = 10 + int(clamped * (700 / 2.0))
+            color = self._LOAD_COLORS[(clamped > 1.0) + (clamped > 1.5)]
+            self.canvas.itemconfig(self.load_rect, fill=color)
+            self.canvas.coords(self.load_rect, 10, 10, x, 30)
 
         # Blink state toggles each refresh
         self.last_blink_state = not self.last_blink_state
 
-        # Update tasks rows
-        for name, info in self.agc.tasks.items():
-            lbl = self.task_rows[name]["stat"]
-            if info["active"]:
-                lbl.config(text="ACTIVE", fg="#10b981")  # green
+        # Update tasks rows, touching only labels whose text or colour changed
+        for name, active in zip(self.task_rows, self.active):
+            if active:
+                row = ("ACTIVE", "#10b981")  # green
             else:
                 # blinking red/yellow to draw attention when suspended
-                blink_fg = "#f87171" if self.last_blink_state else "#fbbf24"
-                lbl.config(text="SUSPENDED", fg=blink_fg)
+                row = ("SUSPENDED", _BLINK_FG[self.last_blink_state])
+            if self._row_state.get(name) != row:
+                self._row_state[name] = row
+                self.task_rows[name]["stat"].config(text=row[0], fg=row[1])
 
         # Optional first paint adjustment
         if initial:
@@ -209,7 +263,7 @@ def run_cli_console(agc: AGCSystem, delay=0.7):
             bar = int(clamped * 20)
             status_line = f"Cycle {agc.cycle:03d} | Load: {load:4.1f}x [{'#' * bar:<20}] {state}"
             print(status_line)
-            for name, info in sorted(agc.tasks.items(), key=lambda item: item[1]["priority"]):
+            for name, info in agc._by_priority:
                 stat = "ACTIVE" if info["active"] else "SUSPENDED"
                 print(f"  - {name:<18} {stat}")
             print()
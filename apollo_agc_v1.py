@@ -7,6 +7,9 @@ import time
 import random
 
 class AGCSystem:
+    # Possible sensor load readings, shared across cycles
+    _LOAD_CHOICES = (0.5, 0.7, 1.0, 1.5, 2.0)
+
     def __init__(self):
         # Each task has a priority (lower = more important)
         self.tasks = {
@@ -15,11 +18,16 @@ class AGCSystem:
             "telemetry": {"priority": 3, "active": True},
             "camera_recording": {"priority": 4, "active": True}
         }
+        # Tasks are static, so resolve the priority order once
+        self._by_priority = tuple(sorted(self.tasks.items(), key=lambda kv: kv[1]["priority"]))
         self.error_flag = False
+        # Pre-drawn sensor loads for a run_cycle batch (empty outside one)
+        self._load_stream = iter(())
 
     def simulate_sensor_load(self):
         # Simulate sensor overload: sometimes returns random spikes
-        return random.choice([0.5, 0.7, 1.0, 1.5, 2.0])
+        load = next(self._load_stream, None)
+        return random.choice(self._LOAD_CHOICES) if load is None else load
 
     def check_system_load(self):
         load = self.simulate_sensor_load()
@@ -40,7 +48,7 @@ class AGCSystem:
 
         # Graceful degradation: suspend lower priority tasks
         print("[RECOVERY] Reallocating resources to critical tasks...")
-        for name, task in sorted(self.tasks.items(), key=lambda t: t[1]["priority"]):
+        for name, task in self._by_priority:
             if task["priority"] > 2:
                 task["active"] = False
                 print(f"  • Suspended: {name}")
@@ -50,10 +58,14 @@ class AGCSystem:
         print("[RECOVERY] Critical operations remain online.\n")
 
     def run_cycle(self):
+        # Pace against a monotonic deadline so per-cycle work does not accumulate drift
+        deadline = time.monotonic()
+        self._load_stream = iter(random.choices(self._LOAD_CHOICES, k=5))
         for _ in range(5):  # Simulate 5 control cycles
             load = self.check_system_load()
             self.recover_and_prioritize()
-            time.sleep(1)
+            deadline += 1.0
+            time.sleep(max(0.0, deadline - time.monotonic()))
 
 # -----------------------------
 # MAIN EXECUTION
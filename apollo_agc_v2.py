@@ -7,6 +7,9 @@ import time
 import random
 
 class AGCSystem:
+    # Possible sensor load readings, shared across cycles
+    _LOAD_CHOICES = (0.6, 0.8, 1.0, 1.3, 1.6, 2.0)
+
     def __init__(self):
         # Each task has a priority (lower = more critical)
         self.tasks = {
@@ -15,12 +18,17 @@ class AGCSystem:
             "telemetry": {"priority": 3, "active": True},
             "camera_recording": {"priority": 4, "active": True}
         }
+        # Tasks are static, so resolve the priority order once
+        self._by_priority = tuple(sorted(self.tasks.items(), key=lambda kv: kv[1]["priority"]))
         self.error_flag = False
+        # Pre-drawn sensor loads for a run_cycle batch (empty outside one)
+        self._load_stream = iter(())
         self.overload_count = 0
 
     def simulate_sensor_load(self):
         # Random system load spikes (simulating radar interference)
-        return random.choice([0.6, 0.8, 1.0, 1.3, 1.6, 2.0])
+        load = next(self._load_stream, None)
+        return random.choice(self._LOAD_CHOICES) if load is None else load
 
     def check_system_load(self):
         load = self.simulate_sensor_load()
@@ -45,7 +53,7 @@ class AGCSystem:
             return
 
         print("[RECOVERY] Overload detected — reallocating CPU resources...")
-        for name, task in sorted(self.tasks.items(), key=lambda t: t[1]["priority"]):
+        for name, task in self._by_priority:
             if task["priority"] > 2:
                 if task["active"]:
                     task["active"] = False
@@ -63,11 +71,15 @@ class AGCSystem:
         print("[RESUME] All systems nominal again.\n")
 
     def run_cycle(self, cycles=8):
+        # Pace against a monotonic deadline so per-cycle work does not accumulate drift
+        deadline = time.monotonic()
+        self._load_stream = iter(random.choices(self._LOAD_CHOICES, k=cycles))
         for i in range(cycles):
             print(f"--- CYCLE {i+1} ---")
             self.check_system_load()
             self.recover_and_prioritize()
-            time.sleep(1)
+            deadline += 1.0
+            time.sleep(max(0.0, deadline - time.monotonic()))
 
 # -----------------------------
 # MAIN EXECUTION
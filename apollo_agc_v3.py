@@ -6,8 +6,22 @@ Inspired by Margaret Hamilton's real-time fault-tolerant executive design (1969)
 import time
 import random
 import os
+import sys
 
 class AGCSystem:
+    # Possible sensor load readings, shared across cycles
+    _LOAD_CHOICES = (0.6, 0.8, 1.0, 1.2, 1.5, 2.0)
+    # ANSI cursor-home + erase-screen
+    _CLEAR = "\x1b[H\x1b[2J"
+    # Static dashboard chrome, formatted once
+    _HEADER = (
+        "\n🛰️  Apollo Guidance Computer — Real-Time Simulation\n"
+        "----------------------------------------------\n"
+    )
+    _TABLE_HEADER = f"{'Task':<20} | {'Priority':<8} | {'Status'}\n" + "-" * 45 + "\n"
+    # Every possible 40-column CPU load bar, indexed by filled length
+    _BARS = tuple("█" * i + "-" * (40 - i) for i in range(41))
+
     def __init__(self):
         self.tasks = {
             "landing_guidance": {"priority": 1, "active": True},
@@ -15,26 +29,48 @@ class AGCSystem:
             "telemetry": {"priority": 3, "active": True},
             "camera_recording": {"priority": 4, "active": True}
         }
+        # Tasks are static, so resolve the priority order once
+        self._by_priority = tuple(sorted(self.tasks.items(), key=lambda kv: kv[1]["priority"]))
+        # Overload gate (priority <= 2 stays online) is static too: evaluate it once per task
+        self._overload_mask = tuple((task, task["priority"] <= 2) for _, task in self._by_priority)
+        # Table rows only vary by status: preformat (suspended, active) lines, indexed by the flag
+        self._row_templates = tuple(
+            (task, (f"{name:<20} | {task['priority']:<8} | 🔴 SUSPENDED\n",
+                    f"{name:<20} | {task['priority']:<8} | 🟢 ACTIVE\n"))
+            for name, task in self.tasks.items()
+        )
         self.error_flag = False
+        # Pre-drawn sensor loads for a run_cycle batch (empty outside one)
+        self._load_stream = iter(())
         self.overload_count = 0
         self.cycle = 0
+        if os.name == 'nt':
+            self._enable_vt_mode()
+
+    def _enable_vt_mode(self):
+        # Windows consoles only honour ANSI escapes once VT processing is switched on
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
 
     def clear_console(self):
-        # Works for macOS, Linux, Windows
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Works for macOS, Linux, Windows without spawning a shell every frame
+        sys.stdout.write(self._CLEAR)
 
     def simulate_sensor_load(self):
-        return random.choice([0.6, 0.8, 1.0, 1.2, 1.5, 2.0])
+        load = next(self._load_stream, None)
+        return random.choice(self._LOAD_CHOICES) if load is None else load
 
     def check_system_load(self):
         load = self.simulate_sensor_load()
-        if load > 1.0:
-            self.error_flag = True
+        self.error_flag = load > 1.0
+        if self.error_flag:
             self.overload_count += 1
-        else:
-            self.error_flag = False
-            if self.overload_count > 0:
-                self.overload_count -= 1
+        elif self.overload_count:
+            self.overload_count -= 1  # gradual cool-down
         return load
 
     def recover_and_prioritize(self):
@@ -43,11 +79,8 @@ class AGCSystem:
                 self.resume_tasks()
             return "STABLE"
 
-        for name, task in sorted(self.tasks.items(), key=lambda t: t[1]["priority"]):
-            if task["priority"] > 2:
-                task["active"] = False
-            else:
-                task["active"] = True
+        for task, critical in self._overload_mask:
+            task["active"] = critical
         return "OVERLOAD"
 
     def resume_tasks(self):
@@ -55,33 +88,35 @@ class AGCSystem:
             task["active"] = True
 
     def render_dashboard(self, load, state):
-        self.clear_console()
         self.cycle += 1
 
         # CPU load bar
-        bar_length = int(min(load, 2.0) * 20)
-        bar = "█" * bar_length + "-" * (40 - bar_length)
-
-        print(f"\n🛰️  Apollo Guidance Computer — Real-Time Simulation")
-        print(f"----------------------------------------------")
-        print(f"Cycle: {self.cycle}")
-        print(f"CPU Load: [{bar}] {load:.2f}x")
-        print(f"System State: {'⚠️  OVERLOAD' if state == 'OVERLOAD' else '✅ STABLE'}\n")
-
-        # Task table
-        print(f"{'Task':<20} | {'Priority':<8} | {'Status'}")
-        print("-" * 45)
-        for name, info in self.tasks.items():
-            status = "🟢 ACTIVE" if info["active"] else "🔴 SUSPENDED"
-            print(f"{name:<20} | {info['priority']:<8} | {status}")
-        print("\n")
+        bar = self._BARS[int(min(load, 2.0) * 20)]
+
+        # Compose the whole frame off-screen, then emit it with a single write
+        parts = [
+            self._CLEAR,
+            self._HEADER,
+            f"Cycle: {self.cycle}\n",
+            f"CPU Load: [{bar}] {load:.2f}x\n",
+            f"System State: {'⚠️  OVERLOAD' if state == 'OVERLOAD' else '✅ STABLE'}\n\n",
+            self._TABLE_HEADER,
+        ]
+        parts.extend(rows[task["active"]] for task, rows in self._row_templates)
+        parts.append("\n\n")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
     def run_cycle(self, cycles=15):
+        # Pace against a monotonic deadline so per-cycle work does not accumulate drift
+        deadline = time.monotonic()
+        self._load_stream = iter(random.choices(self._LOAD_CHOICES, k=cycles))
         for _ in range(cycles):
             load = self.check_system_load()
             state = self.recover_and_prioritize()
             self.render_dashboard(load, state)
-            time.sleep(1)
+            deadline += 1.0
+            time.sleep(max(0.0, deadline - time.monotonic()))
 
 # -----------------------------
 # MAIN EXECUTION